@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 import asyncio
 import contextlib
+import itertools
 import logging
 import math
 import re
@@ -10,6 +11,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # optional: enables safe_divide_array
+    np = None
+
 
 # ---------------------------
 # Module-level constants
@@ -20,6 +26,14 @@ DEFAULT_TIMEOUT = 30.0
 APP_NAME = "ComplexApp"
 VERSION = "2.0.1"
 
+# Precompiled patterns used by slugify()
+_RE_NON_SLUG = re.compile(r"[^a-z0-9\-\s]")
+_RE_WS = re.compile(r"\s+")
+_RE_DASHES = re.compile(r"-+")
+
+# Sentinel for single-lookup dict pops
+_MISSING = object()
+
 # Module-level setup calls
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,7 +43,7 @@ logger = logging.getLogger(__name__)
 # Configuration via dataclass
 # ---------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     name: str
     version: str = "1.0"
@@ -99,6 +113,7 @@ class InMemoryRepository(Repository):
     def __init__(self, config: Config) -> None:
         super().__init__(config)
         self.__store: Dict[str, Any] = {}
+        self._debug = config.debug  # Config is frozen, so this cannot go stale
 
     # Public convenience
     def upsert(self, key: str, value: Any) -> None:
@@ -107,16 +122,15 @@ class InMemoryRepository(Repository):
     # Implementer methods
     def _put_impl(self, key: str, value: Any) -> None:
         self.__store[key] = value
-        if self._config.debug:
+        if self._debug:
             print(f"[DEBUG] PUT {key}={value}")
 
     def _get_impl(self, key: str) -> Optional[Any]:
         return self.__store.get(key)
 
     def _delete_impl(self, key: str) -> bool:
-        existed = key in self.__store
-        self.__store.pop(key, None)
-        if self._config.debug:
+        existed = self.__store.pop(key, _MISSING) is not _MISSING
+        if self._debug:
             print(f"[DEBUG] DEL {key} -> {existed}")
         return existed
 
@@ -160,22 +174,20 @@ def batched(iterable: Iterable[Any], size: int) -> Generator[List[Any], None, No
     """Yield lists of up to `size` items from `iterable`."""
     if size <= 0:
         raise ValueError("size must be > 0")
-    batch: List[Any] = []
-    for item in iterable:
-        batch.append(item)
-        if len(batch) >= size:
-            yield batch
-            batch = []
-    if batch:
-        yield batch
+    it = iter(iterable)
+    if hasattr(itertools, "batched"):
+        # Python 3.12+: chunking happens entirely in C
+        yield from (list(chunk) for chunk in itertools.batched(it, size))
+        return
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
 
 
 def slugify(text: str) -> str:
     """Return a URL-friendly slug from text."""
-    text = text.strip().lower()
-    text = re.sub(r"[^a-z0-9\-\s]", "", text)
-    text = re.sub(r"\s+", "-", text)
-    return re.sub(r"-+", "-", text).strip("-")
+    text = _RE_NON_SLUG.sub("", text.strip().lower())
+    text = _RE_WS.sub("-", text)
+    return _RE_DASHES.sub("-", text).strip("-")
 
 
 def safe_divide(a: float, b: float) -> float:
@@ -185,6 +197,29 @@ def safe_divide(a: float, b: float) -> float:
     return a / b
 
 
+# Optional JIT-compiled kernel for array workloads
+try:
+    from numba import vectorize
+
+    @vectorize(["float64(float64, float64)"], nopython=True, cache=True)
+    def _safe_divide_vec(a, b):
+        return 0.0 if b == 0.0 else a / b
+except ImportError:
+    _safe_divide_vec = None
+
+
+def safe_divide_array(a: Any, b: Any) -> Any:
+    """Element-wise safe_divide over NumPy arrays, using Numba when available."""
+    if _safe_divide_vec is not None:
+        return _safe_divide_vec(a, b)
+    if np is None:
+        raise ImportError("safe_divide_array requires NumPy")
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(b == 0, 0.0, np.divide(a, b))
+
+
 # ---------------------------
 # Async API
 # ---------------------------
@@ -1,4 +1,5 @@
 """Sample demonstrating Python decorators for CodeFrame analysis."""
+import inspect
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
@@ -15,8 +16,49 @@ T = TypeVar("T")
 # Custom decorator functions
 # ---------------------------
 
+_LOG_WRAPPER_FACTORIES: dict[tuple[str, ...], Callable] = {}
+
+# Names used by the generated wrapper source; parameters with this prefix take
+# the generic path so they cannot shadow them
+_LOG_RESERVED_PREFIX = "__lc_"
+
+
+def _log_wrapper_factory(names: tuple[str, ...]) -> Callable:
+    """Return a cached factory building a logging wrapper with a fixed signature."""
+    factory = _LOG_WRAPPER_FACTORIES.get(names)
+    if factory is None:
+        arglist = ", ".join(names)
+        source = (
+            "def make(__lc_func):\n"
+            f"    def wrapper({arglist}):\n"
+            "        __lc_print(f'Calling {__lc_func.__name__}')\n"
+            f"        __lc_result = __lc_func({arglist})\n"
+            "        __lc_print(f'Finished {__lc_func.__name__}')\n"
+            "        return __lc_result\n"
+            "    return wrapper\n"
+        )
+        namespace: dict[str, Any] = {"__lc_print": print}
+        exec(source, namespace)
+        factory = _LOG_WRAPPER_FACTORIES[names] = namespace["make"]
+    return factory
+
+
 def log_calls(func: Callable[..., T]) -> Callable[..., T]:
     """Decorator that logs function calls."""
+    try:
+        params = inspect.signature(func).parameters.values()
+    except (ValueError, TypeError):  # no introspectable signature, e.g. some builtins
+        params = None
+    if params is not None and all(
+        p.kind is p.POSITIONAL_OR_KEYWORD
+        and p.default is p.empty
+        and not p.name.startswith(_LOG_RESERVED_PREFIX)
+        for p in params
+    ):
+        # Plain positional signature: forward by name, no *args/**kwargs packing
+        names = tuple(p.name for p in params)
+        return wraps(func)(_log_wrapper_factory(names)(func))
+
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
         print(f"Calling {func.__name__}")
@@ -31,14 +73,14 @@ def retry(times: int = 3):
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_error: Exception | None = None
             for attempt in range(times):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_error = e
                     print(f"Attempt {attempt + 1} failed: {e}")
-            raise last_error or RuntimeError("All retries failed")
+                    if attempt == times - 1:
+                        raise
+            raise RuntimeError("All retries failed")  # only when times <= 0
         return wrapper
     return decorator
 
@@ -46,10 +88,13 @@ def retry(times: int = 3):
 def validate_args(*validators: Callable[[Any], bool]):
     """Decorator factory that validates arguments."""
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        checks = tuple(validators)
+        count = len(checks)
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            for i, (arg, validator) in enumerate(zip(args, validators)):
-                if not validator(arg):
+            for i in range(min(count, len(args))):
+                if not checks[i](args[i]):
                     raise ValueError(f"Argument {i} failed validation")
             return func(*args, **kwargs)
         return wrapper
@@ -92,9 +137,9 @@ class Calculator:
         self._name = "unnamed"
 
     @property
-    def history(self) -> list[str]:
+    def history(self) -> tuple[str, ...]:
         """Get calculation history (read-only)."""
-        return self._history.copy()
+        return tuple(self._history)
 
     # Static method - no access to instance or class
     @staticmethod
@@ -1,5 +1,9 @@
 """Sample demonstrating Python enums for CodeFrame analysis."""
+import bisect
 from enum import Enum, IntEnum, Flag, auto, unique
+from functools import reduce
+from itertools import accumulate
+from operator import or_
 from typing import Optional
 
 
@@ -32,16 +36,20 @@ class Status(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "Status":
         """Create a Status from a string value."""
-        for status in cls:
-            if status.value == value.lower():
-                return status
-        raise ValueError(f"Unknown status: {value}")
+        key = value.lower()
+        try:
+            return _STATUS_BY_VALUE[key]
+        except KeyError:
+            raise ValueError(f"Unknown status: {value}") from None
 
     def is_terminal(self) -> bool:
         """Check if this is a terminal status."""
         return self in (Status.COMPLETED, Status.CANCELLED)
 
 
+_STATUS_BY_VALUE = {s.value: s for s in Status}
+
+
 # ---------------------------
 # IntEnum - can be used as int
 # ---------------------------
@@ -77,7 +85,10 @@ class ErrorCode(IntEnum):
     @property
     def is_error(self) -> bool:
         """Check if this code represents an error."""
-        return self.value >= 400
+        return _ERRORCODE_IS_ERROR[self]
+
+
+_ERRORCODE_IS_ERROR = {code: code.value >= 400 for code in ErrorCode}
 
 
 # ---------------------------
@@ -118,13 +129,15 @@ class Direction(Enum):
 
     def opposite(self) -> "Direction":
         """Get the opposite direction."""
-        opposites = {
-            Direction.NORTH: Direction.SOUTH,
-            Direction.SOUTH: Direction.NORTH,
-            Direction.EAST: Direction.WEST,
-            Direction.WEST: Direction.EAST,
-        }
-        return opposites[self]
+        return _DIR_OPPOSITES[self]
+
+
+_DIR_OPPOSITES = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.EAST: Direction.WEST,
+    Direction.WEST: Direction.EAST,
+}
 
 
 # ---------------------------
@@ -141,6 +154,7 @@ class Planet(Enum):
     def __init__(self, mass: float, radius: float) -> None:
         self._mass = mass
         self._radius = radius
+        self._surface_gravity = 6.67300e-11 * mass / (radius * radius)
 
     @property
     def mass(self) -> float:
@@ -154,40 +168,45 @@ class Planet(Enum):
 
     @property
     def surface_gravity(self) -> float:
-        """Calculate surface gravity."""
-        G = 6.67300e-11
-        return G * self._mass / (self._radius ** 2)
+        """Get the planet's surface gravity, computed once at definition."""
+        return self._surface_gravity
+
+
+# Planets in definition order, with the running maximum of their masses; the
+# maxima are non-decreasing, so bisect finds the first planet heavier than a bound
+_PLANETS = tuple(Planet)
+_MAX_MASS_SO_FAR = list(accumulate((p._mass for p in _PLANETS), max))
 
 
 # ---------------------------
 # Utility functions
 # ---------------------------
 
+_STATUS_LABELS = {
+    Status.PENDING: "Waiting",
+    Status.ACTIVE: "In Progress",
+    Status.COMPLETED: "Done",
+    Status.CANCELLED: "Cancelled",
+}
+
+
 def get_status_label(status: Status) -> str:
     """Get a human-readable label for a status."""
-    labels = {
-        Status.PENDING: "Waiting",
-        Status.ACTIVE: "In Progress",
-        Status.COMPLETED: "Done",
-        Status.CANCELLED: "Cancelled",
-    }
-    return labels.get(status, "Unknown")
+    try:
+        return _STATUS_LABELS[status]
+    except KeyError:
+        return "Unknown"
 
 
 def combine_permissions(perms: list[Permission]) -> Permission:
     """Combine multiple permissions into one."""
-    result = Permission.NONE
-    for perm in perms:
-        result = result | perm
-    return result
+    return reduce(or_, perms, Permission.NONE)
 
 
 def find_planet_by_mass(min_mass: float) -> Optional[Planet]:
     """Find the first planet with mass greater than min_mass."""
-    for planet in Planet:
-        if planet.mass > min_mass:
-            return planet
-    return None
+    idx = bisect.bisect_right(_MAX_MASS_SO_FAR, min_mass)
+    return _PLANETS[idx] if idx < len(_PLANETS) else None
 
 
 # ---------------------------
@@ -1,5 +1,6 @@
 """Sample demonstrating Python exception handling for CodeFrame analysis."""
 from typing import Any, Optional
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,10 +16,15 @@ class ApplicationError(Exception):
     def __init__(self, message: str, code: int = 0) -> None:
         super().__init__(message)
         self.code = code
-        self.message = message
+        self._str = f"[{code}] {message}"
 
     def __str__(self) -> str:
-        return f"[{self.code}] {self.message}"
+        return self._str
+
+    @property
+    def message(self) -> str:
+        """Get the error message (stored once, in args)."""
+        return self.args[0]
 
 
 class ValidationError(ApplicationError):
@@ -67,6 +73,14 @@ class DataProcessor:
     # Basic try-except
     def parse_int(self, value: str) -> Optional[int]:
         """Parse an integer with basic exception handling."""
+        if isinstance(value, str):
+            # Cheap pre-check so obviously invalid input never raises
+            text = value.strip()
+            digits = text[1:] if text[:1] in ("+", "-") else text
+            if digits.isdecimal():
+                return int(text)
+            if "_" not in digits:
+                return None
         try:
             return int(value)
         except ValueError:
@@ -96,23 +110,16 @@ class DataProcessor:
             logger.info(f"Division successful: {a}/{b}={result}")
             return result
 
-    # Try-except-finally
+    # Try-except around a with block
     def process_file(self, path: str) -> list[str]:
-        """Process a file with cleanup in finally."""
-        handle = None
-        lines: list[str] = []
+        """Process a file, letting the context manager close it."""
         try:
-            handle = open(path, "r")
-            lines = handle.readlines()
+            with open(path, "r") as handle:
+                return handle.readlines()
         except FileNotFoundError:
             raise NotFoundError("File", path)
         except PermissionError:
             raise ApplicationError(f"Permission denied: {path}", code=403)
-        finally:
-            if handle is not None:
-                handle.close()
-                logger.debug(f"Closed file handle: {path}")
-        return lines
 
     # Try-except-else-finally (full form)
     def fetch_data(self, key: str) -> dict[str, Any]:
@@ -155,7 +162,6 @@ class DataProcessor:
         """Load config with exception chaining."""
         try:
             with open(path) as f:
-                import json
                 return json.load(f)
         except FileNotFoundError as e:
             raise NotFoundError("Config", path) from e
@@ -186,13 +192,16 @@ class DataProcessor:
         """Process items, collecting errors for later."""
         results: list[Any] = []
         self._errors.clear()
-        
+
+        # Bind hot-loop methods once instead of per item
+        process = self._process_single
+        append_result = results.append
+        append_error = self._errors.append
         for item in items:
             try:
-                result = self._process_single(item)
-                results.append(result)
+                append_result(process(item))
             except Exception as e:
-                self._errors.append(e)
+                append_error(e)
                 if self._strict:
                     raise
         
@@ -205,9 +214,9 @@ class DataProcessor:
         return {"item": item, "processed": True}
 
     @property
-    def errors(self) -> list[Exception]:
-        """Get collected errors."""
-        return self._errors.copy()
+    def errors(self) -> tuple[Exception, ...]:
+        """Get collected errors (read-only)."""
+        return tuple(self._errors)
 
 
 # ---------------------------
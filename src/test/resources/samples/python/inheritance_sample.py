@@ -1,7 +1,15 @@
 """Sample demonstrating Python inheritance patterns for CodeFrame analysis."""
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
-from typing import Any, Optional
+from functools import cache
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Iterator, Optional
+
+# Bound once so log() skips the global + attribute lookup per entry
+_now = datetime.now
+
+_UNSET = object()
 
 
 # ---------------------------
@@ -10,18 +18,11 @@ from typing import Any, Optional
 
 class Animal(ABC):
     """Abstract base class for animals."""
+    __slots__ = ("name", "age")
 
     def __init__(self, name: str, age: int) -> None:
-        self._name = name
-        self._age = age
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def age(self) -> int:
-        return self._age
+        self.name = name
+        self.age = age
 
     @abstractmethod
     def speak(self) -> str:
@@ -35,7 +36,7 @@ class Animal(ABC):
 
     def describe(self) -> str:
         """Describe the animal."""
-        return f"{self._name} is a {self.age}-year-old {type(self).__name__}"
+        return f"{self.name} is a {self.age}-year-old {type(self).__name__}"
 
 
 # ---------------------------
@@ -44,14 +45,11 @@ class Animal(ABC):
 
 class Dog(Animal):
     """A dog is an animal."""
+    __slots__ = ("breed",)
 
     def __init__(self, name: str, age: int, breed: str) -> None:
         super().__init__(name, age)
-        self._breed = breed
-
-    @property
-    def breed(self) -> str:
-        return self._breed
+        self.breed = breed
 
     def speak(self) -> str:
         return "Woof!"
@@ -61,19 +59,16 @@ class Dog(Animal):
 
     def fetch(self, item: str) -> str:
         """Dogs can fetch things."""
-        return f"{self._name} fetches the {item}"
+        return f"{self.name} fetches the {item}"
 
 
 class Cat(Animal):
     """A cat is an animal."""
+    __slots__ = ("indoor",)
 
     def __init__(self, name: str, age: int, indoor: bool = True) -> None:
         super().__init__(name, age)
-        self._indoor = indoor
-
-    @property
-    def indoor(self) -> bool:
-        return self._indoor
+        self.indoor = indoor
 
     def speak(self) -> str:
         return "Meow!"
@@ -83,25 +78,45 @@ class Cat(Animal):
 
     def purr(self) -> str:
         """Cats can purr."""
-        return f"{self._name} purrs contentedly"
+        return f"{self.name} purrs contentedly"
 
 
 # ---------------------------
 # Mixin Classes
 # ---------------------------
 
+@cache
+def _public_slots(klass: type) -> tuple[str, ...]:
+    """Public slot names along the MRO of klass, base classes first; cached per class."""
+    names: list[str] = []
+    for base in reversed(klass.__mro__):
+        # Only the class's own declaration; getattr would repeat an inherited one
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if not name.startswith("_"))
+    return tuple(names)
+
+
+def _slot_items(obj: object) -> Iterator[tuple[str, Any]]:
+    """Yield (name, value) for each assigned public slot along the MRO, base classes first."""
+    for name in _public_slots(type(obj)):
+        if hasattr(obj, name):
+            yield name, getattr(obj, name)
+
+
 class SerializableMixin:
     """Mixin providing serialization capabilities."""
+    __slots__ = ()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         result: dict[str, Any] = {}
-        for key, value in self.__dict__.items():
-            clean_key = key.lstrip("_")
-            if isinstance(value, datetime):
-                result[clean_key] = value.isoformat()
-            else:
-                result[clean_key] = value
+        for name in _public_slots(type(self)):
+            value = getattr(self, name, _UNSET)
+            if value is _UNSET:
+                continue
+            result[name] = value.isoformat() if isinstance(value, datetime) else value
         return result
 
     @classmethod
@@ -111,17 +126,30 @@ class SerializableMixin:
 
 
 class ComparableMixin:
-    """Mixin providing comparison capabilities."""
+    """Mixin providing comparison capabilities.
+
+    Ordering compares the attribute named by ``_cmp_key``; subclasses may
+    override it. The getter is resolved once per class.
+    """
+    __slots__ = ()
+
+    _cmp_key: ClassVar[str] = "id"
+    _cmp_get: ClassVar[Callable[[Any], Any]] = attrgetter(_cmp_key)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._cmp_get = attrgetter(cls._cmp_key)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return self.__dict__ == other.__dict__
+        return dict(_slot_items(self)) == dict(_slot_items(other))
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return str(self) < str(other)
+        get = self._cmp_get
+        return get(self) < get(other)
 
     def __le__(self, other: object) -> bool:
         return self == other or self < other
@@ -129,42 +157,64 @@ class ComparableMixin:
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return str(self) > str(other)
+        get = self._cmp_get
+        return get(self) > get(other)
 
     def __ge__(self, other: object) -> bool:
         return self == other or self > other
 
 
 class LoggableMixin:
-    """Mixin providing logging capabilities."""
+    """Mixin providing logging capabilities.
 
-    _log: list[str] = []
+    The bounded log lives in a ``_log`` attribute created on first use. Slotted
+    users must declare the ``_log`` slot themselves; it cannot live here without
+    a layout conflict with slotted bases.
+    """
+    __slots__ = ()
+
+    _LOG_MAXLEN: int = 1024
+
+    def _init_log(self) -> None:
+        """Give this instance its own bounded log."""
+        self._log: deque[str] = deque(maxlen=self._LOG_MAXLEN)
 
     def log(self, message: str) -> None:
         """Log a message."""
-        timestamp = datetime.now().isoformat()
-        entry = f"[{timestamp}] {type(self).__name__}: {message}"
-        self._log.append(entry)
+        entry = f"[{_now().isoformat()}] {type(self).__name__}: {message}"
+        try:
+            self._log.append(entry)
+        except AttributeError:
+            self._init_log()
+            self._log.append(entry)
 
     def get_logs(self) -> list[str]:
         """Get all log entries."""
-        return self._log.copy()
+        try:
+            return list(self._log)
+        except AttributeError:
+            self._init_log()
+            return []
 
     def clear_logs(self) -> None:
         """Clear all log entries."""
-        self._log.clear()
+        try:
+            self._log.clear()
+        except AttributeError:
+            self._init_log()
 
 
 class ValidatableMixin:
     """Mixin providing validation capabilities."""
+    __slots__ = ()
 
     def validate(self) -> list[str]:
         """Validate the object and return list of errors."""
-        errors: list[str] = []
-        for key, value in self.__dict__.items():
-            if value is None:
-                errors.append(f"{key} cannot be None")
-        return errors
+        return [
+            f"{name} cannot be None"
+            for name in _public_slots(type(self))
+            if getattr(self, name, _UNSET) is None
+        ]
 
     def is_valid(self) -> bool:
         """Check if the object is valid."""
@@ -177,25 +227,25 @@ class ValidatableMixin:
 
 class Entity(SerializableMixin, ComparableMixin, ValidatableMixin):
     """Base entity with serialization, comparison, and validation."""
+    __slots__ = ("id", "created_at")
 
-    def __init__(self, id: int, created_at: Optional[datetime] = None) -> None:
-        self._id = id
-        self._created_at = created_at or datetime.now()
+    _str_prefix: ClassVar[str] = "Entity(id="
 
-    @property
-    def id(self) -> int:
-        return self._id
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._str_prefix = f"{cls.__name__}(id="
 
-    @property
-    def created_at(self) -> datetime:
-        return self._created_at
+    def __init__(self, id: int, created_at: Optional[datetime] = None) -> None:
+        self.id = id
+        self.created_at = created_at or datetime.now()
 
     def __str__(self) -> str:
-        return f"{type(self).__name__}(id={self._id})"
+        return f"{self._str_prefix}{self.id})"
 
 
 class User(Entity, LoggableMixin):
     """User entity with logging."""
+    __slots__ = ("username", "email", "_log")
 
     def __init__(
         self,
@@ -205,35 +255,29 @@ class User(Entity, LoggableMixin):
         created_at: Optional[datetime] = None,
     ) -> None:
         super().__init__(id, created_at)
-        self._username = username
-        self._email = email
-
-    @property
-    def username(self) -> str:
-        return self._username
-
-    @property
-    def email(self) -> str:
-        return self._email
+        self.username = username
+        self.email = email
+        self._init_log()
 
     def change_email(self, new_email: str) -> None:
         """Change user's email."""
-        old_email = self._email
-        self._email = new_email
+        old_email = self.email
+        self.email = new_email
         self.log(f"Email changed from {old_email} to {new_email}")
 
     def validate(self) -> list[str]:
         """Validate user data."""
         errors = super().validate()
-        if "@" not in self._email:
+        if "@" not in self.email:
             errors.append("Invalid email format")
-        if len(self._username) < 3:
+        if len(self.username) < 3:
             errors.append("Username must be at least 3 characters")
         return errors
 
 
 class Product(Entity):
     """Product entity."""
+    __slots__ = ("name", "price")
 
     def __init__(
         self,
@@ -243,27 +287,26 @@ class Product(Entity):
         created_at: Optional[datetime] = None,
     ) -> None:
         super().__init__(id, created_at)
-        self._name = name
-        self._price = price
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def price(self) -> float:
-        return self._price
+        self.name = name
+        self.price = price
 
     def validate(self) -> list[str]:
         """Validate product data."""
         errors = super().validate()
-        if self._price < 0:
+        if self.price < 0:
             errors.append("Price cannot be negative")
-        if not self._name:
+        if not self.name:
             errors.append("Name cannot be empty")
         return errors
 
 
+class DigitalProduct(Product):
+    """Product subclass that declares no __slots__ of its own."""
+
+    def is_downloadable(self) -> bool:
+        return True
+
+
 # ---------------------------
 # Diamond Inheritance (MRO demonstration)
 # ---------------------------
@@ -301,12 +344,24 @@ class C(A):
 class D(B, C):
     """Class D extends B and C (diamond inheritance)."""
 
+    # The MRO is fixed at class creation, so its names are computed once per class:
+    # by __init_subclass__ for subclasses, and after the class body for D itself,
+    # since the hook does not fire for the class that defines it
+    _MRO_NAMES: ClassVar[tuple[str, ...]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._MRO_NAMES = tuple(klass.__name__ for klass in cls.__mro__)
+
     def method(self) -> str:
         return f"D -> {super().method()}"
 
     def show_mro(self) -> list[str]:
         """Show the Method Resolution Order."""
-        return [cls.__name__ for cls in type(self).__mro__]
+        return list(self._MRO_NAMES)
+
+
+D._MRO_NAMES = tuple(klass.__name__ for klass in D.__mro__)
 
 
 # ---------------------------
@@ -315,36 +370,24 @@ class D(B, C):
 
 class SlottedBase:
     """Base class using __slots__."""
-    __slots__ = ("_x", "_y")
+    __slots__ = ("x", "y")
 
     def __init__(self, x: int, y: int) -> None:
-        self._x = x
-        self._y = y
-
-    @property
-    def x(self) -> int:
-        return self._x
-
-    @property
-    def y(self) -> int:
-        return self._y
+        self.x = x
+        self.y = y
 
 
 class SlottedChild(SlottedBase):
     """Child class extending slots."""
-    __slots__ = ("_z",)
+    __slots__ = ("z",)
 
     def __init__(self, x: int, y: int, z: int) -> None:
         super().__init__(x, y)
-        self._z = z
-
-    @property
-    def z(self) -> int:
-        return self._z
+        self.z = z
 
     def coordinates(self) -> tuple[int, int, int]:
         """Get all coordinates."""
-        return (self._x, self._y, self._z)
+        return (self.x, self.y, self.z)
 
 
 # ---------------------------
@@ -361,6 +404,11 @@ if __name__ == "__main__":
     user = User(1, "john_doe", "john@example.com")
     print(user.to_dict())
     print(f"Valid: {user.is_valid()}")
+
+    # Subclass without __slots__ reports each inherited slot once
+    ebook = DigitalProduct(2, None, 9.99)
+    assert _public_slots(DigitalProduct) == ("id", "created_at", "name", "price")
+    assert ebook.validate() == ["name cannot be None", "Name cannot be empty"]
     
     # Diamond inheritance
     d = D()
@@ -1,6 +1,13 @@
 """Sample demonstrating nested structures in Python for CodeFrame analysis."""
+from functools import cache
+from operator import add, mul, sub
 from typing import Any, Callable, TypeVar
 
+try:
+    import numpy as np
+except ImportError:  # optional: enables DataTransformer.from_ints
+    np = None
+
 T = TypeVar("T")
 
 
@@ -38,13 +45,16 @@ class Outer:
         def greet(self) -> str:
             return f"Hello, {self._name}"
 
+    # Bound in the class namespace so create_inner skips the global Outer lookup
+    _Inner = Inner
+
     def __init__(self, label: str) -> None:
         self._label = label
         self._inner: Outer.Inner | None = None
 
     def create_inner(self, value: int) -> "Outer.Inner":
         """Create an Inner instance."""
-        self._inner = Outer.Inner(value)
+        self._inner = self._Inner(value)
         return self._inner
 
     def get_label(self) -> str:
@@ -101,10 +111,16 @@ class Node:
         return Node.Builder()
 
     def traverse(self) -> list[Any]:
-        """Traverse the tree depth-first."""
-        result = [self._value]
-        for child in self._children:
-            result.extend(child.traverse())
+        """Traverse the tree depth-first (pre-order), without recursion."""
+        result: list[Any] = []
+        stack = [self]
+        append = result.append
+        push = stack.extend
+        pop = stack.pop
+        while stack:
+            node = pop()
+            append(node._value)
+            push(reversed(node._children))
         return result
 
 
@@ -131,50 +147,47 @@ def make_multiplier(factor: int) -> Callable[[int], int]:
     return multiply
 
 
-def create_operations() -> dict[str, Callable[[int, int], int]]:
-    """Create a dictionary of operations using nested functions."""
+def _divide(a: int, b: int) -> int:
+    if b == 0:
+        raise ValueError("Cannot divide by zero")
+    return a // b
 
-    def add(a: int, b: int) -> int:
-        return a + b
 
-    def subtract(a: int, b: int) -> int:
-        return a - b
+_OPERATIONS: dict[str, Callable[[int, int], int]] = {
+    "add": add,
+    "subtract": sub,
+    "multiply": mul,
+    "divide": _divide,
+}
 
-    def multiply(a: int, b: int) -> int:
-        return a * b
 
-    def divide(a: int, b: int) -> int:
-        if b == 0:
-            raise ValueError("Cannot divide by zero")
-        return a // b
-
-    return {
-        "add": add,
-        "subtract": subtract,
-        "multiply": multiply,
-        "divide": divide,
-    }
+def create_operations() -> dict[str, Callable[[int, int], int]]:
+    """Create a dictionary of operations backed by the operator module."""
+    return dict(_OPERATIONS)
 
 
 def memoize(func: Callable[..., T]) -> Callable[..., T]:
-    """Create a memoized version of a function using nested function."""
-    cache: dict[tuple, T] = {}
-
-    def wrapper(*args: Any) -> T:
-        key = args
-        if key not in cache:
-            cache[key] = func(*args)
-        return cache[key]
-
-    wrapper.__name__ = func.__name__
-    wrapper.__doc__ = func.__doc__
-    return wrapper
+    """Create a memoized version of a function backed by functools.cache."""
+    return cache(func)
 
 
 # ---------------------------
 # Lambda Functions
 # ---------------------------
 
+# Built once at import rather than on every ListProcessor call
+def _is_positive(x: Any) -> bool:
+    return x > 0
+
+
+def _double(x: Any) -> Any:
+    return x * 2
+
+
+def _str_len(s: Any) -> int:
+    return len(str(s))
+
+
 class ListProcessor:
     """Demonstrates lambda functions."""
 
@@ -183,24 +196,23 @@ class ListProcessor:
 
     def filter_positive(self) -> list[int]:
         """Filter positive numbers using lambda."""
-        return list(filter(lambda x: x > 0, self._items))
+        return list(filter(_is_positive, self._items))
 
     def double_values(self) -> list[int]:
         """Double all values using lambda."""
-        return list(map(lambda x: x * 2, self._items))
+        return list(map(_double, self._items))
 
     def sort_by_length(self) -> list[str]:
         """Sort strings by length using lambda."""
-        return sorted(self._items, key=lambda s: len(str(s)))
+        return sorted(self._items, key=_str_len)
 
     def sort_by_key(self, key: str) -> list[dict]:
-        """Sort dictionaries by a key using lambda."""
+        """Sort dictionaries by a key, treating a missing key as 0."""
         return sorted(self._items, key=lambda d: d.get(key, 0))
 
     def reduce_sum(self) -> int:
-        """Sum all items using reduce with lambda."""
-        from functools import reduce
-        return reduce(lambda acc, x: acc + x, self._items, 0)
+        """Sum all items."""
+        return sum(self._items)
 
     def find_first(self, predicate: Callable[[Any], bool]) -> Any | None:
         """Find first item matching predicate."""
@@ -214,21 +226,49 @@ class ListProcessor:
 # ---------------------------
 
 class DataTransformer:
-    """Demonstrates various comprehensions."""
+    """Demonstrates various comprehensions.
+
+    Instances built with ``from_ints`` keep an int64 array and run the numeric
+    transforms in NumPy; mixed data goes through the comprehensions.
+    """
+
+    # Array path only for values whose squares and sums stay well inside int64
+    _ARRAY_BOUND: int = 2**31 - 1
 
     def __init__(self, data: list[Any]) -> None:
         self._data = data
+        self._arr = None
+
+    @classmethod
+    def from_ints(cls, data: list[int]) -> "DataTransformer":
+        """Create a transformer for all-int data, array-backed when NumPy is available."""
+        if any(type(x) is not int for x in data):
+            raise TypeError("from_ints requires int values")
+        transformer = cls(data)
+        bound = cls._ARRAY_BOUND
+        if np is not None and (not data or (-bound <= min(data) and max(data) <= bound)):
+            transformer._arr = np.asarray(data, dtype=np.int64)
+        return transformer
 
     def list_comprehension(self) -> list[int]:
         """List comprehension with condition."""
+        arr = self._arr
+        if arr is not None:
+            return (arr[arr > 0] * 2).tolist()
         return [x * 2 for x in self._data if isinstance(x, int) and x > 0]
 
     def dict_comprehension(self) -> dict[str, int]:
         """Dictionary comprehension."""
+        arr = self._arr
+        if arr is not None:
+            return dict(zip(map(str, arr.tolist()), (arr * arr).tolist()))
         return {str(x): x ** 2 for x in self._data if isinstance(x, int)}
 
     def set_comprehension(self) -> set[int]:
         """Set comprehension."""
+        arr = self._arr
+        if arr is not None:
+            return set(np.abs(arr).tolist())
         return {abs(x) for x in self._data if isinstance(x, int)}
 
     def nested_comprehension(self) -> list[tuple[int, int]]:
@@ -237,10 +277,16 @@ class DataTransformer:
 
     def generator_expression(self) -> int:
         """Generator expression (lazy evaluation)."""
+        arr = self._arr
+        if arr is not None:
+            return int(arr.sum())
         return sum(x for x in self._data if isinstance(x, int))
 
     def conditional_expression(self) -> list[str]:
         """List comprehension with conditional expression."""
+        arr = self._arr
+        if arr is not None:
+            return np.where(arr > 0, "positive", "non-positive").tolist()
         return ["positive" if x > 0 else "non-positive" for x in self._data if isinstance(x, int)]
 
 
@@ -272,23 +318,22 @@ def sort_with_key(
 
 def create_calculator():
     """Create a calculator with nested operation functions."""
-    result = [0]  # Mutable container for nonlocal-like behavior
+    total = 0
 
     def add(x: int) -> None:
-        def do_add() -> None:
-            result[0] += x
-        do_add()
+        nonlocal total
+        total += x
 
     def subtract(x: int) -> None:
-        def do_subtract() -> None:
-            result[0] -= x
-        do_subtract()
+        nonlocal total
+        total -= x
 
     def get_result() -> int:
-        return result[0]
+        return total
 
     def reset() -> None:
-        result[0] = 0
+        nonlocal total
+        total = 0
 
     return {
         "add": add,
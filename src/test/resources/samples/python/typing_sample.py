@@ -3,7 +3,9 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from collections.abc import Iterable, Iterator, Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from math import hypot
+from threading import Lock
 from typing import (
     Any,
     Callable,
@@ -17,10 +19,30 @@ from typing import (
     TypeAlias,
     TypeVar,
     Union,
+    get_args,
     overload,
     runtime_checkable,
 )
 
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized distances()
+    np = None
+
+try:
+    from numba import int64, njit
+    from numba.experimental import jitclass
+except ImportError:  # optional: compiled kernels for NumPy int/float data
+    njit = None
+else:
+    @njit(cache=True)
+    def _find_max_nb(arr):
+        result = arr[0]
+        for i in range(1, arr.shape[0]):
+            if arr[i] > result:
+                result = arr[i]
+        return result
+
 
 # ---------------------------
 # Type Variables
@@ -64,13 +86,25 @@ class Point(NamedTuple):
 
     def distance_from_origin(self) -> float:
         """Calculate distance from origin."""
-        return (self.x ** 2 + self.y ** 2) ** 0.5
+        return hypot(self.x, self.y)
 
     def translate(self, dx: float, dy: float) -> Point:
         """Create a translated point."""
         return Point(self.x + dx, self.y + dy)
 
 
+def distances(points: Any) -> list[float]:
+    """Distances from the origin for a sequence or (N, 2) array of points."""
+    if np is None:
+        return [hypot(x, y) for x, y in points]
+    arr = np.asarray(points, dtype=np.float64)
+    if arr.size == 0:
+        return []
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError(f"expected points of shape (N, 2), got {arr.shape}")
+    return np.hypot(arr[:, 0], arr[:, 1]).tolist()
+
+
 class Person(NamedTuple):
     """Person with optional fields."""
     name: str
@@ -83,18 +117,17 @@ class Person(NamedTuple):
         return f"Hello, I'm {self.name}, {self.age} years old"
 
 
-class Rectangle(NamedTuple):
-    """A rectangle defined by two points."""
+@dataclass(frozen=True, slots=True)
+class Rectangle:
+    """A rectangle defined by two points; width and height are computed once."""
     top_left: Point
     bottom_right: Point
+    width: float = field(init=False)
+    height: float = field(init=False)
 
-    @property
-    def width(self) -> float:
-        return abs(self.bottom_right.x - self.top_left.x)
-
-    @property
-    def height(self) -> float:
-        return abs(self.bottom_right.y - self.top_left.y)
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "width", abs(self.bottom_right.x - self.top_left.x))
+        object.__setattr__(self, "height", abs(self.bottom_right.y - self.top_left.y))
 
     def area(self) -> float:
         return self.width * self.height
@@ -176,6 +209,40 @@ class Stack(Generic[T]):
         return len(self._items) == 0
 
 
+if njit is not None:
+    @jitclass([("_items", int64[:]), ("_n", int64)])
+    class StackI64:
+        """Stack of int64 values backed by a growable NumPy buffer."""
+
+        def __init__(self, capacity: int = 16) -> None:
+            self._items = np.empty(max(capacity, 1), np.int64)
+            self._n = 0
+
+        def push(self, item: int) -> None:
+            """Push an item onto the stack."""
+            if self._n == self._items.shape[0]:
+                grown = np.empty(2 * self._n, np.int64)
+                grown[: self._n] = self._items
+                self._items = grown
+            self._items[self._n] = item
+            self._n += 1
+
+        def pop(self) -> int:
+            """Pop an item from the stack."""
+            if self._n == 0:
+                raise IndexError("Stack is empty")
+            self._n -= 1
+            return self._items[self._n]
+
+        def peek(self) -> int | None:
+            """Peek at the top item."""
+            return self._items[self._n - 1] if self._n else None
+
+        def is_empty(self) -> bool:
+            """Check if the stack is empty."""
+            return self._n == 0
+
+
 class Pair(Generic[K, V]):
     """Generic pair/tuple class."""
 
@@ -241,10 +308,13 @@ class Configuration:
 
     VERSION: Final[str] = "1.0.0"
     _instance_count: ClassVar[int] = 0
+    _instance_lock: ClassVar[Lock] = Lock()
     DEFAULT_TIMEOUT: ClassVar[int] = 30
 
     def __init__(self, name: str) -> None:
-        Configuration._instance_count += 1
+        with Configuration._instance_lock:
+            Configuration._instance_count += 1
+            self._instance_id: Final[int] = Configuration._instance_count
         self._name: Final[str] = name
         self._settings: dict[str, Any] = {}
 
@@ -266,20 +336,30 @@ Direction = Literal["north", "south", "east", "west"]
 HttpMethod = Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+_DIRECTIONS = frozenset(get_args(Direction))
+_HTTP_METHODS = frozenset(get_args(HttpMethod))
+_LOG_LEVELS = frozenset(get_args(LogLevel))
+
 
 class Router:
     """Demonstrates Literal types."""
 
     def navigate(self, direction: Direction) -> str:
         """Navigate in a direction."""
+        if direction not in _DIRECTIONS:
+            raise ValueError(f"Invalid direction: {direction!r}")
         return f"Moving {direction}"
 
     def request(self, method: HttpMethod, url: str) -> dict[str, Any]:
         """Make an HTTP request."""
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"Invalid HTTP method: {method!r}")
         return {"method": method, "url": url, "status": 200}
 
     def log(self, level: LogLevel, message: str) -> None:
         """Log a message at the specified level."""
+        if level not in _LOG_LEVELS:
+            raise ValueError(f"Invalid log level: {level!r}")
         print(f"[{level}] {message}")
 
 
@@ -361,6 +441,13 @@ def merge_dicts(d1: dict[K, V], d2: dict[K, V]) -> dict[K, V]:
 
 def find_max(items: Iterable[Numeric]) -> Numeric | None:
     """Find the maximum of numeric items."""
+    if (
+        njit is not None
+        and isinstance(items, np.ndarray)
+        and items.ndim == 1
+        and items.dtype.kind in "iuf"
+    ):
+        return _find_max_nb(items) if items.size else None
     result: Numeric | None = None
     for item in items:
         if result is None or item > result: